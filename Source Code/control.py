@@ -1,4 +1,5 @@
 import time
+import socket
 import subprocess
 import redis
 import sys
@@ -7,26 +8,52 @@ import os
 REDIS_HOST = '192.168.200.51'
 REDIS_PORT = 6379
 REDIS_KEY = 'flappy_bird:game_on'
+REDIS_CHANNEL = 'flappy_bird:game_on_ch'
 REDIS_FLAPPY_HEARTBEAT = 'flappy_bird:heartbeat_time'
+REDIS_HEARTBEAT_TTL_SECONDS = 3
 REDIS_POLLING_INTERVAL_SECONDS = 1 
 REDIS_SUBJECT_ID = 'metadata:subject_id'
 REDIS_SIMULATOR_RUN = 'metadata:simulator_run'
 REDIS_COMMENTS ='metadata:comments'
 REDIS_TEST_RUN_GUID = 'metadata:guid'
+REDIS_MAX_CONNECTIONS = 4
+REDIS_SOCKET_TIMEOUT_SECONDS = 2
+MAIN_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
 
 def is_main_running(proc):
     return proc and proc.poll() is None
 
 def stop_process(proc):
-    if is_main_running(proc):
-        proc.terminate()
-        try:
-            proc.wait(timeout=REDIS_POLLING_INTERVAL_SECONDS)
-        except subprocess.TimeoutExpired:
-            proc.kill()  
-            proc.wait()
-
-def run_main_script(subject_id, simulator_run, comments, test_run_guid):
+    # Callers only stop a process they have just seen running, so don't poll
+    # again; terminate() is a no-op if it exited in the meantime.
+    proc.terminate()
+    try:
+        proc.wait(timeout=REDIS_POLLING_INTERVAL_SECONDS)
+    except subprocess.TimeoutExpired:
+        proc.kill()  
+        proc.wait()
+
+def set_controller_scheduling():
+    # Pin the controller to one core at a low real-time priority so heartbeats
+    # and flag checks keep their 1s cadence on a loaded host. Linux only, and
+    # SCHED_RR needs CAP_SYS_NICE; anything unavailable is skipped. Returns the
+    # CPU set from before pinning so the game can be given it back, or None.
+    if not hasattr(os, 'sched_setaffinity'):
+        return None
+    cpus = os.sched_getaffinity(0)
+    try:
+        os.sched_setaffinity(0, {min(cpus)})
+    except OSError as e:
+        print(f"Warning: Could not pin controller to a CPU ({e})")
+        return None
+    try:
+        # RESET_ON_FORK: the game process starts with normal scheduling
+        os.sched_setscheduler(0, os.SCHED_RR | os.SCHED_RESET_ON_FORK, os.sched_param(1))
+    except OSError as e:
+        print(f"Warning: Could not set real-time priority ({e})")
+    return cpus
+
+def run_main_script(subject_id, simulator_run, comments, test_run_guid, cpus=None):
     def to_arg(value):
         if value is None:
             return ""
@@ -36,7 +63,7 @@ def run_main_script(subject_id, simulator_run, comments, test_run_guid):
 
     args = [
         sys.executable,
-        "main.py",
+        MAIN_SCRIPT,
         "--subject-id",
         to_arg(subject_id),
         "--simulator-run",
@@ -46,20 +73,33 @@ def run_main_script(subject_id, simulator_run, comments, test_run_guid):
         "--test-run-guid",
         to_arg(test_run_guid),
     ]
-    return subprocess.Popen(args, cwd=os.path.dirname(__file__))
+    # main.py resolves assets and its data directory from its own location, so
+    # no cwd is needed. Without cwd and with close_fds=False, Popen starts the
+    # game through os.posix_spawn rather than fork/exec; the Redis sockets are
+    # non-inheritable, so the child does not receive them.
+    proc = subprocess.Popen(args, close_fds=False)
+    if cpus is not None:
+        # The child inherits the controller's pinning; give it all CPUs back
+        try:
+            os.sched_setaffinity(proc.pid, cpus)
+        except OSError as e:
+            print(f"Warning: Could not restore game CPU affinity ({e})")
+    return proc
 
-def check_redis_flag(r):
-    val = r.get(REDIS_KEY)
+def parse_flag(val):
     if val is not None:
-        val = val.decode('utf-8').lower()
-        return val in ['1', 'true', 'yes']
+        if isinstance(val, bytes):
+            val = val.decode('utf-8')
+        return str(val).lower() in ['1', 'true', 'yes']
     return False
 
+def check_redis_flag(r):
+    return parse_flag(r.get(REDIS_KEY))
+
 def get_redis_id_flags(r):
-    subject_id = r.get(REDIS_SUBJECT_ID)
-    simulator_run = r.get(REDIS_SIMULATOR_RUN)
-    comments = r.get(REDIS_COMMENTS)
-    test_run_guid = r.get(REDIS_TEST_RUN_GUID)
+    subject_id, simulator_run, comments, test_run_guid = r.mget(
+        REDIS_SUBJECT_ID, REDIS_SIMULATOR_RUN, REDIS_COMMENTS, REDIS_TEST_RUN_GUID
+    )
 
     print(f"Subject ID: {subject_id.decode('utf-8') if subject_id else 'None'}")
     print(f"Simulator Run: {simulator_run.decode('utf-8') if simulator_run else 'None'}")
@@ -69,32 +109,95 @@ def get_redis_id_flags(r):
     return subject_id, simulator_run, comments, test_run_guid
 
 
+def create_redis_client():
+    # One long-lived pool shared by commands and the pub/sub subscription.
+    # redis-py already sets TCP_NODELAY on every socket it opens; keepalive
+    # lets a dead link to the Redis host be detected without waiting on a read.
+    keepalive_options = {}
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        keepalive_options[socket.TCP_KEEPIDLE] = 30
+    pool = redis.BlockingConnectionPool(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        socket_keepalive=True,
+        socket_keepalive_options=keepalive_options,
+        socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+    )
+    return redis.Redis(connection_pool=pool)
+
 def main():
-    r = redis.Redis(host=REDIS_HOST, port=REDIS_PORT)
+    game_cpus = set_controller_scheduling()
+    r = create_redis_client()
     proc = None
 
-    while True:
-        try:
-            flag = check_redis_flag(r)
-
-            proc_is_running = is_main_running(proc)
-
-            if proc_is_running:
-                r.set(REDIS_FLAPPY_HEARTBEAT, time.time())
-
-            if flag and not proc_is_running:
-                print("Flag is True. Starting main.py...")
-                subject_id, simulator_run, comments, test_run_guid = get_redis_id_flags(r)
-                proc = run_main_script(subject_id, simulator_run, comments, test_run_guid)
-            elif not flag and proc_is_running:
-                print("Flag is False. Stopping main.py...")
-                stop_process(proc)
-                proc = None
-
-            time.sleep(REDIS_POLLING_INTERVAL_SECONDS)
-        except Exception as e:
-            print(f"Error: {e}")
-            time.sleep(REDIS_POLLING_INTERVAL_SECONDS)
+    # Publishers SET the key and PUBLISH the same value on the channel. The
+    # controller blocks on the channel so start/stop takes effect as soon as
+    # the message arrives; the key is only re-read when the wait times out,
+    # which also covers writers that SET without publishing.
+    pubsub = None
+    flag = False
+    last_heartbeat = 0
+
+    try:
+        while True:
+            try:
+                if pubsub is None:
+                    # Subscribed inside the retry loop, so a controller started
+                    # while Redis is down waits for it instead of exiting. The
+                    # key is read once subscribed to catch up on the flag.
+                    new_pubsub = r.pubsub(ignore_subscribe_messages=True)
+                    try:
+                        new_pubsub.subscribe(REDIS_CHANNEL)
+                    except Exception:
+                        new_pubsub.close()
+                        raise
+                    pubsub = new_pubsub
+                    flag = check_redis_flag(r)
+
+                proc_is_running = is_main_running(proc)
+
+                if flag and not proc_is_running:
+                    print("Flag is True. Starting main.py...")
+                    subject_id, simulator_run, comments, test_run_guid = get_redis_id_flags(r)
+                    proc = run_main_script(subject_id, simulator_run, comments, test_run_guid, game_cpus)
+                    proc_is_running = True
+                elif not flag and proc_is_running:
+                    print("Flag is False. Stopping main.py...")
+                    stop_process(proc)
+                    proc = None
+                    proc_is_running = False
+
+                msg = pubsub.get_message(timeout=REDIS_POLLING_INTERVAL_SECONDS)
+
+                # Flag re-read (on timeout) and heartbeat share one round trip.
+                # The heartbeat is written at most once per second and expires
+                # on its own, so observers can tell when the game has stopped.
+                pipe = r.pipeline(transaction=False)
+                if msg is None:
+                    pipe.get(REDIS_KEY)
+                now = time.time()
+                if proc_is_running and int(now) != last_heartbeat:
+                    pipe.setex(REDIS_FLAPPY_HEARTBEAT, REDIS_HEARTBEAT_TTL_SECONDS, now)
+                    last_heartbeat = int(now)
+                results = pipe.execute()
+
+                if msg is not None:
+                    flag = parse_flag(msg['data'])
+                else:
+                    flag = parse_flag(results[0])
+            except Exception as e:
+                print(f"Error: {e}")
+                time.sleep(REDIS_POLLING_INTERVAL_SECONDS)
+    finally:
+        # Best effort: the connection may already be gone, and an error here
+        # must not hide the one that ended the loop
+        if pubsub is not None:
+            try:
+                pubsub.unsubscribe()
+            except Exception:
+                pass
+            pubsub.close()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
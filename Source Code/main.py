@@ -19,10 +19,15 @@
 import pygame
 import sys
 import random
+import math
 import csv
 import time
+import queue
+import threading
 import argparse
+import atexit
 import os
+from collections import deque
 from datetime import datetime
 
 
@@ -37,17 +42,28 @@ def resource_path(*parts):
 # GLOBAL CONFIGURATION
 # ============================================================================
 DEBUG_MODE      = True
-FPS             = 120
-GRAVITY         = 0.25      # Downward acceleration applied per frame
+FPS             = 60        # Render frame cap (input and physics run at PHYSICS_RATE)
+PHYSICS_RATE    = 120       # Fixed physics steps per second
+GRAVITY         = 0.25      # Downward acceleration applied per physics step
 FLAP_STRENGTH   = 8         # Upward velocity impulse on flap
 PIPE_SPAWN_TIME = 1200      # Milliseconds between pipe generation
 PIPE_GAP        = 300       # Vertical space between top and bottom pipes
 
+# Fixed-timestep loop
+PHYSICS_STEP      = 1.0 / PHYSICS_RATE   # Seconds of game time per physics step
+MAX_PHYSICS_STEPS = 8                    # Cap on catch-up steps in a single frame
+INACTIVE_WAIT_MS  = 50                   # Loop period while the window is minimized
+
+# Prerendered bird rotations (degrees)
+BIRD_ROTATION_STEP = 2      # Spacing between prerendered angles
+BIRD_MAX_TILT_UP   = 30     # Nose-up limit (a flap peaks at FLAP_STRENGTH * 3)
+BIRD_MAX_TILT_DOWN = 90     # Nose-down limit
+
 # Base design resolution (used for scaling assets/layout)
 BASE_SCREEN_WIDTH  = 576
 BASE_SCREEN_HEIGHT = 1024
 
-# Base pipe speed in design space (pixels per frame at base resolution)
+# Base pipe speed in design space (pixels per physics step at base resolution)
 BASE_PIPE_SPEED = 4
 
 # Base positions and thresholds in design space (scaled at runtime)
@@ -74,53 +90,84 @@ def scale_y(y: float) -> int:
 # CORE LOGIC
 # ============================================================================
 
-def draw_floor():
+# Static text rendered on top of the floor
+# Content and Colors
+# Text structure: [ ("Text", (R, G, B)) ]
+FOOTER_TEXT_PARTS = [
+#     ("Developed by ", (255, 255, 255)),           # White
+#     ("Amey Thakur ", (85, 172, 238)),             # Sky Blue
+#     ("& ", (255, 255, 255)),                      # White
+#     ("Mega Satish", (85, 172, 238))               # Sky Blue
+]
+
+
+def build_footer_strip():
     """
-    Renders the infinite scrolling floor effect.
+    Pre-renders the footer text and its drop shadow into a single surface.
     
+    Returns:
+        tuple: (strip_surface, (x, y)) ready to blit, or None if there is no text.
+        
     Logic:
-        Two identical floor surfaces are drawn side-by-side. As they move left,
-        if the first one leaves the screen, it resets to the right, creating
-        a seamless loop.
+        Fragments are laid out left to right, centered horizontally just
+        above the bottom of the screen, each over a black shadow offset by
+        2px. The text never changes, so this runs once at startup.
     """
-    floor_y = SCREEN_HEIGHT - floor_surface.get_height()
-    screen.blit(floor_surface, (floor_x_position, floor_y))
-    screen.blit(floor_surface, (floor_x_position + floor_surface.get_width(), floor_y))
-
-    # Render static text on top of the floor
-    # Content and Colors
-    # Text structure: [ ("Text", (R, G, B)) ]
-    text_parts = [
-    #     ("Developed by ", (255, 255, 255)),           # White
-    #     ("Amey Thakur ", (85, 172, 238)),             # Sky Blue
-    #     ("& ", (255, 255, 255)),                      # White
-    #     ("Mega Satish", (85, 172, 238))               # Sky Blue
-    ]
+    if not FOOTER_TEXT_PARTS:
+        return None
 
     # Calculate Total Width for Centering
     total_width = 0
     surfaces = []
-    for text, color in text_parts:
+    for text, color in FOOTER_TEXT_PARTS:
         surface = footer_font.render(text, True, color)
         shadow = footer_font.render(text, True, (0, 0, 0)) # Black shadow
-        width = surface.get_width()
-        total_width += width
-        surfaces.append( (surface, shadow, width) )
+        total_width += surface.get_width()
+        surfaces.append( (surface, shadow) )
 
     # Starting X Position (Centered)
-    current_x = (SCREEN_WIDTH - total_width) // 2
+    start_x = (SCREEN_WIDTH - total_width) // 2
     # Position text just above the bottom of the screen
-    text_y = SCREEN_HEIGHT - int(62 * (SCREEN_HEIGHT / BASE_SCREEN_HEIGHT))
+    text_height = max(surface.get_height() for surface, _ in surfaces)
+    strip_top = FOOTER_Y - text_height // 2
+
+    # Compose fragments into one strip (2px extra for the shadow offset)
+    strip = pygame.Surface((total_width + 2, text_height + 2), pygame.SRCALPHA)
+    current_x = 0
+    for surface, shadow in surfaces:
+        top = FOOTER_Y - surface.get_height() // 2 - strip_top
+        strip.blit(shadow, (current_x + 2, top + 2)) # Draw shadow first
+        strip.blit(surface, (current_x, top)) # Draw text on top
+        current_x += surface.get_width()
+
+    return strip.convert_alpha(), (start_x, strip_top)
+
+
+def draw_floor(floor_x_position):
+    """
+    Renders the infinite scrolling floor effect.
     
-    # Render Loop
-    for surface, shadow, width in surfaces:
-        surface_rect = surface.get_rect(midleft=(current_x, text_y))
-        shadow_rect = shadow.get_rect(midleft=(current_x + 2, text_y + 2)) # Offset shadow
+    Parameters:
+        floor_x_position (int): Current scroll offset of the floor, in
+            (-floor width, 0].
         
-        screen.blit(shadow, shadow_rect) # Draw shadow first
-        screen.blit(surface, surface_rect) # Draw text on top
+    Logic:
+        `floor_strip` holds two identical floor tiles side-by-side. As it moves
+        left, once the first tile leaves the screen the offset resets to the
+        right, creating a seamless loop. Any offset in range is covered by a
+        single blit; SDL clips it to the screen. The pre-composed footer text
+        is drawn on top.
         
-        current_x += width
+    Returns:
+        list: Screen rects that were drawn to.
+    """
+    floor_y = SCREEN_HEIGHT - floor_strip.get_height()
+    dirty = [screen.blit(floor_strip, (floor_x_position, floor_y))]
+
+    # Render static text on top of the floor
+    if footer_blit is not None:
+        dirty.append(screen.blit(*footer_blit))
+    return dirty
 
 
 def create_pipe():
@@ -135,31 +182,34 @@ def create_pipe():
         Calculates the position of the bottom pipe primarily, then
         derives the top pipe's position by subtracting the PIPE_GAP.
     """
-    random_pipe_position = random.choice(pipe_height)
-    spawn_x = scale_x(BASE_PIPE_SPAWN_X)
+    random_pipe_position = pipe_random.choice(pipe_height)
     
     # Bottom Pipe: Anchored at midtop position
-    bottom_pipe = pipe_surface.get_rect(midtop=(spawn_x, random_pipe_position))
+    bottom_pipe = pipe_surface.get_rect(midtop=(PIPE_SPAWN_X, random_pipe_position))
     
     # Top Pipe: Anchored relative to bottom pipe with fixed gap
-    top_pipe = pipe_surface.get_rect(midbottom=(spawn_x, random_pipe_position - PIPE_GAP))
+    top_pipe = pipe_surface.get_rect(midbottom=(PIPE_SPAWN_X, random_pipe_position - PIPE_GAP))
     
     return bottom_pipe, top_pipe
 
 
 def move_pipes(pipes):
     """
-    Updates the horizontal position of all active pipes.
+    Updates the horizontal position of all active pipes, in place.
     
     Parameters:
-        pipes (list): List of pygame.Rect objects representing pipes.
+        pipes (deque): pygame.Rect objects representing pipes, in spawn order.
         
-    Returns:
-        list: Updated list of moved pipes.
+    Logic:
+        Pipes that have scrolled fully past the left edge are dropped so the
+        queue only ever holds the few pipes that are still on screen. All
+        pipes move at the same speed, so they leave in spawn order and only
+        the front of the queue needs checking.
     """
     for pipe in pipes:
-        pipe.centerx -= PIPE_SPEED   # Move pipe leftward by scaled pixels per frame
-    return pipes
+        pipe.move_ip(-PIPE_SPEED, 0)   # Move pipe leftward by scaled pixels per step
+    while pipes and pipes[0].right <= 0:
+        pipes.popleft()
 
 
 def draw_pipes(pipes):
@@ -172,169 +222,211 @@ def draw_pipes(pipes):
         logic is simplified here by context or we flip based on position.
         In this implementation, logic infers orientation based on geometry:
         - If the pipe's bottom is at or below the screen bottom, it's a bottom pipe.
-        - Otherwise, it's a top pipe and we flip the sprite vertically.
+        - Otherwise, it's a top pipe and we use the flipped sprite.
+        Both orientations are areas of the one `pipe_atlas` surface, and all
+        pipes are drawn with a single `screen.blits` call.
+        
+    Returns:
+        list: Screen rects that were drawn to.
     """
-    for pipe in pipes:
-        if pipe.bottom >= SCREEN_HEIGHT:
-            # Bottom pipe (Standard orientation)
-            screen.blit(pipe_surface, pipe)
-        else:
-            # Top pipe (Flipped vertically)
-            flip_pipe = pygame.transform.flip(pipe_surface, False, True)
-            screen.blit(flip_pipe, pipe)
+    # Bottom pipe (Standard orientation) / Top pipe (Flipped vertically).
+    # The returned rects are clipped to the screen, which the dirty-rect
+    # background restore relies on, so they are kept (doreturn=True).
+    return screen.blits([
+        (pipe_atlas, pipe, PIPE_AREA_BOTTOM if pipe.bottom >= SCREEN_HEIGHT else PIPE_AREA_TOP)
+        for pipe in pipes
+    ])
 
 
-def check_collision(pipes):
+def check_collision(bird_rect, pipes):
     """
     Performs Axis-Aligned Bounding Box (AABB) collision detection.
     
     Parameters:
+        bird_rect (pygame.Rect): The bird's bounding box.
         pipes (list): List of obstacle rectangles.
         
     Returns:
         tuple: (bool, str) - (False if collision detected, collision_type)
                 Returns (True, None) if no collision.
-        
-    Side Effects:
-        Plays `death_sound` upon collision detection.
     """
-    global game_active
-    
-    # 1. Pipe Collision
-    for pipe in pipes:
-        if bird_rectangle.colliderect(pipe):
-            if game_active:
-                death_sound.play()
-                game_active = False
-            return False, 'pipe'
+    # 1. Pipe Collision (collidelist scans every pipe rect in one C call)
+    if bird_rect.collidelist(pipes) != -1:
+        return False, 'pipe'
 
     # 2. Environmental Collision (Floor/Ceiling)
-    # Thresholds scaled from base design space
-    ceiling_threshold = scale_y(BASE_CEILING_COLLISION_Y)
-    floor_threshold   = scale_y(BASE_FLOOR_COLLISION_Y)
-
     # Ceiling Collision
-    if bird_rectangle.top <= ceiling_threshold:
-        if game_active:
-             death_sound.play()
-             game_active = False
+    if bird_rect.top <= CEILING_COLLISION_Y:
         return False, 'ceiling'
     # Floor Collision
-    if bird_rectangle.bottom >= floor_threshold:
-        if game_active:
-             death_sound.play()
-             game_active = False
+    if bird_rect.bottom >= FLOOR_COLLISION_Y:
         return False, 'floor'
 
     return True, None
 
 
-def rotate_bird(bird):
+def rotate_bird(bird_movement):
     """
-    Applies affine transformation (rotation) to the bird sprite.
+    Returns the bird sprite rotated to match its vertical velocity.
     
+    Parameters:
+        bird_movement (float): Vertical velocity of the bird.
+        
     Logic:
         Rotation angle is proportional to vertical velocity (`bird_movement`).
         - Upward movement (negative velocity) -> Rotate Up (CCW).
         - Downward movement (positive velocity) -> Rotate Down (CW).
         Multiplier (3) exaggerates the visual effect.
+        The angle is snapped to the `BIRD_ROTATION_STEP` grid and clamped to
+        [-BIRD_MAX_TILT_DOWN, BIRD_MAX_TILT_UP], then looked up in
+        `bird_rotations`.
         
     Returns:
         pygame.Surface: The rotated image surface.
     """
-    new_bird = pygame.transform.rotozoom(bird, -bird_movement * 3, 1)
-    return new_bird
+    angle = int(-bird_movement * 3) // BIRD_ROTATION_STEP * BIRD_ROTATION_STEP
+    angle = max(-BIRD_MAX_TILT_DOWN, min(BIRD_MAX_TILT_UP, angle))
+    return bird_rotations[angle]
 
 
-def bird_animation():
-    """
-    Updates the bird's sprite frame to simulate wing flapping.
-    
-    Returns:
-        tuple: (new_bird_surface, new_bird_rect)
-    """
-    new_bird = bird_frames[bird_index]
-    new_bird_rectangle = new_bird.get_rect(
-        center=(scale_x(BASE_BIRD_X), bird_rectangle.centery)
-    )
-    return new_bird, new_bird_rectangle
+# Rendered score strings keyed by their text. The score only changes when a
+# pipe is passed, so almost every frame is a lookup instead of a font render.
+_score_cache = {}
+SCORE_CACHE_SIZE = 128
 
 
-def score_display(game_state):
+def render_score_text(text):
+    """Return the rendered surface for a score string, rendering it on first use."""
+    surface = _score_cache.get(text)
+    if surface is None:
+        if len(_score_cache) >= SCORE_CACHE_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del _score_cache[next(iter(_score_cache))]
+        surface = game_font.render(text, True, (255, 255, 255)).convert_alpha()
+        _score_cache[text] = surface
+    return surface
+
+
+def score_display(game_state, score, high_score):
     """
     Renders textual score information based on game state.
     
     Parameters:
         game_state (str): 'main_game' or 'game_over'.
+        score (int): Score of the current attempt.
+        high_score (int): Best score this session.
+        
+    Returns:
+        list: Screen rects that were drawn to.
     """
+    dirty = []
     if game_state == 'main_game':
         # Live Score
-        score_surface = game_font.render(str(int(score)), True, (255, 255, 255))
+        score_surface = render_score_text(str(int(score)))
         score_rectangle = score_surface.get_rect(
-            center=(SCREEN_WIDTH // 2, scale_y(BASE_SCORE_Y))
+            center=(SCREEN_WIDTH // 2, SCORE_Y)
         )
-        screen.blit(score_surface, score_rectangle)
+        dirty.append(screen.blit(score_surface, score_rectangle))
 
     if game_state == 'game_over':
         # Score Summary
-        score_surface = game_font.render(f'Score: {int(score)}', True, (255, 255, 255))
+        score_surface = render_score_text(f'Score: {int(score)}')
         score_rectangle = score_surface.get_rect(
-            center=(SCREEN_WIDTH // 2, scale_y(BASE_SCORE_Y))
+            center=(SCREEN_WIDTH // 2, SCORE_Y)
         )
-        screen.blit(score_surface, score_rectangle)
+        dirty.append(screen.blit(score_surface, score_rectangle))
 
         # High Score
-        high_score_surface = game_font.render(f'High Score: {int(high_score)}', True, (255, 255, 255))
+        high_score_surface = render_score_text(f'High Score: {int(high_score)}')
         high_score_rectangle = high_score_surface.get_rect(
-            center=(SCREEN_WIDTH // 2, scale_y(BASE_HIGHSCORE_Y))
+            center=(SCREEN_WIDTH // 2, HIGHSCORE_Y)
         )
-        screen.blit(high_score_surface, high_score_rectangle)
+        dirty.append(screen.blit(high_score_surface, high_score_rectangle))
+    return dirty
+
+
+# Last debug overlay message and its rendered surface
+_debug_cache = (None, None)
 
 
 def debug_event_display(logger, display_duration_ms=1000):
     """
     Render the most recently logged event in the top-left corner for a short time.
     Intended purely for debugging/inspection while playing.
+    Returns the screen rects that were drawn to.
     """
     if logger is None or logger.last_event_message is None:
-        return
+        return []
 
     # Compute how long ago the last event was logged
-    now_ms = int((time.time() - logger.game_start_time) * 1000)
+    now_ms = logger.elapsed_ms()
     if now_ms - logger.last_event_timestamp > display_duration_ms:
-        return
-
-    # Prepare text surface (use serif font for debug)
-    text_surface = debug_font.render(logger.last_event_message, True, (255, 255, 0))
+        return []
+
+    # Prepare text surface (use serif font for debug). The message is shown
+    # for a whole second, so render it once and reuse it until it changes.
+    global _debug_cache
+    if _debug_cache[0] != logger.last_event_message:
+        _debug_cache = (
+            logger.last_event_message,
+            debug_font.render(logger.last_event_message, True, (255, 255, 0)).convert_alpha(),
+        )
+    text_surface = _debug_cache[1]
     # Offset slightly below the very top edge, scaled with screen height
-    overlay_y = scale_y(40)
-    text_rect = text_surface.get_rect(topleft=(10, overlay_y))
+    text_rect = text_surface.get_rect(topleft=(10, DEBUG_OVERLAY_Y))
 
     # Draw a simple background box for readability
     bg_rect = text_rect.inflate(10, 6)
-    pygame.draw.rect(screen, (0, 0, 0), bg_rect)
+    dirty = pygame.draw.rect(screen, (0, 0, 0), bg_rect)
 
     # Blit text on top
     screen.blit(text_surface, text_rect)
+    return [dirty]
+
+
+# Rendered word widths keyed by (font, word). wrap_text sums these instead of
+# measuring every candidate line, so re-wrapping a field after a key press
+# only measures words it has not seen before.
+_word_width_cache = {}
+WORD_WIDTH_CACHE_SIZE = 512
+
+
+def word_width(font, word):
+    """Return the rendered width of `word` in `font`, measuring it on first use."""
+    key = (font, word)
+    width = _word_width_cache.get(key)
+    if width is None:
+        if len(_word_width_cache) >= WORD_WIDTH_CACHE_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del _word_width_cache[next(iter(_word_width_cache))]
+        width = font.size(word)[0]
+        _word_width_cache[key] = width
+    return width
 
 
 def wrap_text(text, font, max_width):
     """
     Simple word-wrap helper.
     Splits `text` into a list of lines that fit within `max_width`.
+    Line widths are the sum of cached word and space widths.
     """
     words = text.split(" ")
     lines = []
     current_line = ""
+    current_width = 0
+    space_width = word_width(font, " ")
 
     for word in words:
-        test_line = word if current_line == "" else current_line + " " + word
-        if font.size(test_line)[0] <= max_width:
-            current_line = test_line
+        width = word_width(font, word)
+        test_width = width if current_line == "" else current_width + space_width + width
+        if test_width <= max_width:
+            current_line = word if current_line == "" else current_line + " " + word
+            current_width = test_width
         else:
             if current_line:
                 lines.append(current_line)
             current_line = word
+            current_width = width
 
     if current_line:
         lines.append(current_line)
@@ -399,6 +491,48 @@ def collect_session_metadata():
     current_field = 0
     done = False
 
+    # Dialog layout and static text never change while the dialog is open,
+    # so lay them out and render them once up front.
+    dialog_width = SCREEN_WIDTH - 120
+    dialog_height = 360
+    dialog_rect = pygame.Rect(
+        (SCREEN_WIDTH - dialog_width) // 2,
+        (SCREEN_HEIGHT - dialog_height) // 2,
+        dialog_width,
+        dialog_height,
+    )
+
+    # Title
+    title_surface = game_font.render("Session Info", True, (255, 255, 255))
+    title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, dialog_rect.top + 40))
+
+    # Instructions (wrapped to fit inside the dialog)
+    instructions = "TAB / ENTER to move fields. ENTER on last field to start. ESC to skip."
+    instr_blits = []
+    instr_y = title_rect.bottom + 25
+    instructions_bottom = instr_y
+    for line in wrap_text(instructions, footer_font, dialog_width - 60):
+        instr_surface = footer_font.render(line, True, (200, 100, 200))
+        instr_rect = instr_surface.get_rect(center=(SCREEN_WIDTH // 2, instr_y))
+        instr_blits.append((instr_surface, instr_rect))
+        instructions_bottom = instr_rect.bottom
+        instr_y += instr_surface.get_height() + 4
+
+    # Field labels in both their highlighted and normal colors
+    start_y = instructions_bottom + 30
+    line_height = 40
+    label_surfaces = [
+        {
+            True: footer_font.render(f"{field['label']}:", True, (255, 255, 0)),
+            False: footer_font.render(f"{field['label']}:", True, (200, 200, 200)),
+        }
+        for field in fields
+    ]
+
+    # Rendered field values, re-rendered only when the text changes:
+    # {field index: (value, [line surfaces])}
+    value_cache = {}
+
     while not done:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -433,68 +567,43 @@ def collect_session_metadata():
         # Draw dialog
         screen.blit(background_surface, (0, 0))
 
-        dialog_width = SCREEN_WIDTH - 120
-        dialog_height = 360
-        dialog_rect = pygame.Rect(
-            (SCREEN_WIDTH - dialog_width) // 2,
-            (SCREEN_HEIGHT - dialog_height) // 2,
-            dialog_width,
-            dialog_height,
-        )
-
         # Background and border
         pygame.draw.rect(screen, (0, 0, 0), dialog_rect)
         pygame.draw.rect(screen, (255, 255, 255), dialog_rect, 2)
 
-        # Title
-        title_surface = game_font.render("Session Info", True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, dialog_rect.top + 40))
         screen.blit(title_surface, title_rect)
-
-        # Instructions (wrapped to fit inside the dialog)
-        instructions = "TAB / ENTER to move fields. ENTER on last field to start. ESC to skip."
-        instr_lines = wrap_text(instructions, footer_font, dialog_width - 60)
-        instr_y = title_rect.bottom + 25
-        instructions_bottom = instr_y
-        for line in instr_lines:
-            instr_surface = footer_font.render(line, True, (200, 100, 200))
-            instr_rect = instr_surface.get_rect(center=(SCREEN_WIDTH // 2, instr_y))
+        for instr_surface, instr_rect in instr_blits:
             screen.blit(instr_surface, instr_rect)
-            instructions_bottom = instr_rect.bottom
-            instr_y += instr_surface.get_height() + 4
 
         # Fields
-        start_y = instructions_bottom + 30
-        line_height = 40
+        value_color = (255, 255, 255)
         for idx, field in enumerate(fields):
-            label_color = (255, 255, 0) if idx == current_field else (200, 200, 200)
-            value_color = (255, 255, 255)
-
-            label_surface = footer_font.render(f"{field['label']}:", True, label_color)
             base_y = start_y + idx * line_height
+            label_surface = label_surfaces[idx][idx == current_field]
             label_rect = label_surface.get_rect(topleft=(dialog_rect.left + 30, base_y))
-
-            text_value = field["value"] if field["value"] else "_"
-
             screen.blit(label_surface, label_rect)
 
-            # Wrap comments visually so they don't overflow the dialog
-            if field["label"] == "Comments":
-                wrapped_lines = wrap_text(text_value, footer_font, dialog_width - 260)
-                value_y = base_y
-                for v_line in wrapped_lines:
-                    value_surface = footer_font.render(v_line, True, value_color)
-                    value_rect = value_surface.get_rect(
-                        topleft=(dialog_rect.left + 220, value_y)
-                    )
-                    screen.blit(value_surface, value_rect)
-                    value_y += value_surface.get_height() + 2
-            else:
-                value_surface = footer_font.render(text_value, True, value_color)
+            cached = value_cache.get(idx)
+            if cached is None or cached[0] != field["value"]:
+                text_value = field["value"] if field["value"] else "_"
+                # Wrap comments visually so they don't overflow the dialog
+                if field["label"] == "Comments":
+                    value_lines = wrap_text(text_value, footer_font, dialog_width - 260)
+                else:
+                    value_lines = [text_value]
+                cached = (
+                    field["value"],
+                    [footer_font.render(v_line, True, value_color) for v_line in value_lines],
+                )
+                value_cache[idx] = cached
+
+            value_y = base_y
+            for value_surface in cached[1]:
                 value_rect = value_surface.get_rect(
-                    topleft=(dialog_rect.left + 220, base_y)
+                    topleft=(dialog_rect.left + 220, value_y)
                 )
                 screen.blit(value_surface, value_rect)
+                value_y += value_surface.get_height() + 2
 
         pygame.display.update()
         clock.tick(30)
@@ -524,7 +633,18 @@ class EventLogger:
     - Collisions
     - Pipe passages
     - Key presses
+    
+    `log_event` only timestamps the event and queues it; a background writer
+    thread formats the rows and does the file I/O, so the game loop never
+    waits on disk. Rows are flushed once `FLUSH_EVENTS` are pending or
+    `FLUSH_INTERVAL` seconds have passed, and immediately for collisions and
+    quitting.
     """
+
+    FLUSH_INTERVAL = 1.0   # Seconds between buffered flushes
+    FLUSH_EVENTS   = 32    # Pending rows that force a flush
+    QUEUE_SIZE     = 4096  # Rows queued for the writer before log_event blocks
+    WRITE_BATCH    = 256   # Rows the writer takes from the queue per write
     
     def __init__(self, subject_id, simulator_run, test_run_guid):
 
@@ -542,8 +662,10 @@ class EventLogger:
         
         self.attempt_id = 0
         self.csv_file = None
-        self.writer = None
         self.game_start_time = time.time()
+        self._start_ns = time.monotonic_ns()
+        self._queue = None
+        self._writer = None
 
         # In-memory debug fields for on-screen display
         self.last_event_message = None
@@ -551,44 +673,56 @@ class EventLogger:
         
         # Create CSV file with headers
         try:
-            self.csv_file = open(self.filename, 'w', newline='', encoding='utf-8')
-            self.writer = csv.writer(self.csv_file)
+            self.csv_file = open(self.filename, 'w', buffering=8192, newline='', encoding='utf-8')
             # Columns:
             #   unix_timestamp: absolute time (seconds since Unix epoch, float)
-            #   timestamp:      ms since game_start_time
-            self.writer.writerow(['unix_timestamp', 'timestamp', 'attempt_id', 'event', 'additional_info'])
+            #   timestamp:      ms since game_start_time (monotonic clock)
+            csv.writer(self.csv_file).writerow(['unix_timestamp', 'timestamp', 'attempt_id', 'event', 'additional_info'])
             self.csv_file.flush()  # Ensure headers are written immediately
+
+            self._queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+            self._writer = threading.Thread(
+                target=self._writer_loop, args=(self._queue,), name='EventLogWriter', daemon=True
+            )
+            self._writer.start()
+            # Drain and close on any interpreter exit, not only the quit paths
+            atexit.register(self.close)
             print(f"Event logging initialized: {self.filename}")
         except Exception as e:
             print(f"Warning: Could not initialize event logger ({e})")
+            # Undo whatever was set up before the failure: stop the writer if
+            # it started, then close the file instead of leaking the handle
+            if self._writer is not None and self._writer.is_alive():
+                self._queue.put(None)
+                self._writer.join()
+            self._writer = None
+            if self.csv_file is not None:
+                try:
+                    self.csv_file.close()
+                except OSError:
+                    pass
             self.csv_file = None
-            self.writer = None
+            self._queue = None
     
-    def log_event(self, event, additional_info=None):
+    def log_event(self, event, additional_info=None, flush=False):
         """
         Log an event with current timestamp.
         
         Parameters:
             event (str): Type of event (e.g., 'TRIAL_START', 'COLLISION', etc.)
             additional_info (str): Optional additional information about the event
+            flush (bool): Write buffered rows to disk right away
         """
-        if self.writer is None:
+        if self._queue is None:
             return
         
         try:
             unix_ts = time.time()
-            timestamp = int((time.time() - self.game_start_time) * 1000)
-            info = additional_info if additional_info is not None else ''
-
-            # Persist to CSV
-            self.writer.writerow([
-                unix_ts,
-                timestamp,
-                self.attempt_id,
-                event,
-                info
-            ])
-            self.csv_file.flush()  # Write immediately to prevent data loss
+            timestamp = self.elapsed_ms()
+            info = str(additional_info) if additional_info is not None else ''
+
+            # Hand the row to the writer thread
+            self._queue.put((unix_ts, timestamp, self.attempt_id, event, info, flush))
 
             # Update in-memory debug info for on-screen display
             if info != '':
@@ -599,6 +733,58 @@ class EventLogger:
         except Exception as e:
             print(f"Warning: Failed to log event ({e})")
     
+    def _writer_loop(self, write_queue):
+        """
+        Background thread: writes rows from `write_queue` to the CSV file
+        until `close` queues None.
+        """
+        pending = 0  # Rows written since the last flush
+        last_flush = time.monotonic()
+        running = True
+
+        while running:
+            try:
+                rows = [write_queue.get(timeout=self.FLUSH_INTERVAL)]
+            except queue.Empty:
+                rows = []
+            # Take whatever else is already queued, up to a batch
+            while len(rows) < self.WRITE_BATCH:
+                try:
+                    rows.append(write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                lines = []
+                flush = False
+                for row in rows:
+                    if row is None:
+                        running = False
+                        break
+                    unix_ts, timestamp, attempt_id, event, info, flush_row = row
+                    # Rows are formatted directly; only free-text info (e.g.
+                    # session comments) ever needs csv-style quoting.
+                    if ',' in info or '"' in info or '\r' in info or '\n' in info:
+                        info = '"' + info.replace('"', '""') + '"'
+                    lines.append(f"{unix_ts},{timestamp},{attempt_id},{event},{info}\r\n")
+                    flush = flush or flush_row
+
+                if lines:
+                    self.csv_file.write(''.join(lines))
+                    pending += len(lines)
+                now = time.monotonic()
+                if pending and (flush or not running or pending >= self.FLUSH_EVENTS
+                                or now - last_flush > self.FLUSH_INTERVAL):
+                    self.csv_file.flush()
+                    pending = 0
+                    last_flush = now
+            except Exception as e:
+                print(f"Warning: Failed to log event ({e})")
+
+    def elapsed_ms(self):
+        """Milliseconds since the logger was created, from the monotonic clock."""
+        return (time.monotonic_ns() - self._start_ns) // 1_000_000
+
     def log_collision(self, collision_type):
         """
         Log a collision event.
@@ -606,7 +792,7 @@ class EventLogger:
         Parameters:
             collision_type (str): Type of collision ('pipe' or 'boundary')
         """
-        self.log_event('COLLISION', additional_info=collision_type)
+        self.log_event('COLLISION', additional_info=collision_type, flush=True)
     
     def log_pipe_passed(self, score):
         """
@@ -630,26 +816,39 @@ class EventLogger:
         """
         Log the quit event.
         """
-        self.log_event('QUIT')
+        self.log_event('QUIT', flush=True)
         
     def close(self):
         """Close the CSV file and finalize logging."""
+        if self._writer is not None:
+            # Stop taking new rows, then let the writer drain the queue
+            write_queue, self._queue = self._queue, None
+            write_queue.put(None)
+            self._writer.join()
+            self._writer = None
         if self.csv_file:
             try:
                 self.csv_file.close()
                 print(f"Event logging completed: {self.filename}")
             except Exception as e:
                 print(f"Warning: Error closing event logger ({e})")
+            self.csv_file = None
 
 
 # ============================================================================
 # INITIALIZATION
 # ============================================================================
 
-# Audio Mixer: Pre-init required to avoid audio lag
-pygame.mixer.pre_init(frequency=44100, size=16, channels=1, buffer=512)
+# Audio Mixer: Pre-init required to avoid audio lag. Signed 16-bit samples;
+# a 1024-sample buffer (~23 ms) avoids underruns on Linux/ALSA that 512 hits.
+pygame.mixer.pre_init(frequency=44100, size=-16, channels=1, buffer=1024)
 pygame.init()
 
+# The game targets pygame-ce (see README); upstream pygame still runs it, with
+# slower blits, event handling and font rendering.
+if not getattr(pygame, 'IS_CE', False):
+    print("Warning: pygame-ce is not installed; running on upstream pygame (pip install pygame-ce)")
+
 # Display Setup
 display_info = pygame.display.Info()
 SCREEN_WIDTH = display_info.current_w
@@ -661,8 +860,23 @@ pygame.display.set_caption("Flappy Bird")
 # At the base height (1024), this evaluates to 2.0, matching the original scale2x.
 SPRITE_SCALE = 2.0 * (SCREEN_HEIGHT / BASE_SCREEN_HEIGHT)
 
-# Pipe speed in pixels per frame, scaled with screen width
-PIPE_SPEED = BASE_PIPE_SPEED * (SCREEN_WIDTH / BASE_SCREEN_WIDTH)
+# Pipe speed in whole pixels per physics step, scaled with screen width.
+# Rect positions are integers, so a fractional speed is rounded up here; that
+# is the distance on-screen pipes already moved when `centerx -= speed` was
+# truncated back to an int.
+PIPE_SPEED = math.ceil(BASE_PIPE_SPEED * (SCREEN_WIDTH / BASE_SCREEN_WIDTH))
+
+# Layout positions and thresholds in screen pixels. The screen size is fixed
+# from here on, so scale the design-space values once instead of on every use.
+BIRD_X              = scale_x(BASE_BIRD_X)
+BIRD_Y              = scale_y(BASE_BIRD_Y)
+SCORE_Y             = scale_y(BASE_SCORE_Y)
+HIGHSCORE_Y         = scale_y(BASE_HIGHSCORE_Y)
+FLOOR_COLLISION_Y   = scale_y(BASE_FLOOR_COLLISION_Y)
+CEILING_COLLISION_Y = scale_y(BASE_CEILING_COLLISION_Y)
+PIPE_SPAWN_X        = scale_x(BASE_PIPE_SPAWN_X)
+FOOTER_Y            = SCREEN_HEIGHT - scale_y(62)
+DEBUG_OVERLAY_Y     = scale_y(40)
 
 # Icon Setup
 try:
@@ -691,54 +905,70 @@ except:
     footer_font = pygame.font.SysFont('Arial', 20, bold=True)
     # Serif debug font fallback
     debug_font = pygame.font.SysFont('Times New Roman', 18, bold=True)
-bird_movement       = 0
-game_active         = False
-score               = 0
-high_score          = 0
-floor_x_position    = 0
-pipe_list           = []
-pipe_height         = [scale_y(h) for h in BASE_PIPE_HEIGHTS]
+
+# Footer text is static: compose it once, draw_floor just blits the result
+footer_blit = build_footer_strip()
+
+pipe_height         = tuple(scale_y(h) for h in BASE_PIPE_HEIGHTS)
+# Dedicated generator for pipe heights: the obstacle sequence is independent
+# of any other use of the global `random` module state.
+pipe_random         = random.Random()
 
 # ============================================================================
 # ASSET MANAGEMENT
 # ============================================================================
 
+class ChannelSound:
+    """
+    A sound bound to its own reserved mixer channel.
+    
+    play() starts the sound on that channel directly instead of having the
+    mixer search for a free one, and one effect never steals another's
+    channel.
+    """
+    def __init__(self, sound, channel):
+        self.sound = sound
+        self.channel = channel
+
+    def play(self):
+        self.channel.play(self.sound)
+
+
+# Every surface blitted per frame must end up in the display's pixel format:
+# .convert() for opaque textures, .convert_alpha() for sprites, applied after
+# the last transform. An unconverted source makes SDL translate every pixel on
+# every blit instead of using its SIMD same-format blitters.
 try:
     # Textures
-    background_surface = pygame.image.load(resource_path('assets', 'background-day.png')).convert()
-    background_surface = pygame.transform.scale(background_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    background_surface = pygame.image.load(resource_path('assets', 'background-day.png'))
+    background_surface = pygame.transform.scale(background_surface, (SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
 
-    floor_surface = pygame.image.load(resource_path('assets', 'base.png')).convert()
+    floor_surface = pygame.image.load(resource_path('assets', 'base.png'))
     # Floor height scales proportionally with screen height
     floor_height = int(100 * (SCREEN_HEIGHT / BASE_SCREEN_HEIGHT))
-    floor_surface = pygame.transform.scale(floor_surface, (SCREEN_WIDTH, floor_height))
+    floor_surface = pygame.transform.scale(floor_surface, (SCREEN_WIDTH, floor_height)).convert()
     
-    # Bird Animation Frames (scaled to screen resolution)
+    # Bird sprite (scaled to screen resolution). The bird is drawn with the
+    # mid-flap sprite only; it is not animated.
     bird_raw = pygame.image.load(resource_path('assets', 'bluebird-midflap.png')).convert_alpha()
-    bird_downflap = pygame.transform.rotozoom(bird_raw, 0, SPRITE_SCALE)
-    bird_midflap  = pygame.transform.rotozoom(bird_raw, 0, SPRITE_SCALE)
-    bird_upflap   = pygame.transform.rotozoom(bird_raw, 0, SPRITE_SCALE)
-    bird_frames   = [bird_downflap, bird_midflap, bird_upflap]
-    bird_index    = 0
-    bird_surface  = bird_frames[bird_index]
-    bird_rectangle= bird_surface.get_rect(
-        center=(scale_x(BASE_BIRD_X), scale_y(BASE_BIRD_Y))
-    )
+    bird_surface = pygame.transform.rotozoom(bird_raw, 0, SPRITE_SCALE).convert_alpha()
 
     # Obstacles & UI (scaled to screen resolution)
     pipe_raw       = pygame.image.load(resource_path('assets', 'pipe-green.png')).convert_alpha()
-    pipe_surface   = pygame.transform.rotozoom(pipe_raw, 0, SPRITE_SCALE)
+    pipe_surface   = pygame.transform.rotozoom(pipe_raw, 0, SPRITE_SCALE).convert_alpha()
     
     game_over_raw      = pygame.image.load(resource_path('assets', 'message.png')).convert_alpha()
-    game_over_surface  = pygame.transform.rotozoom(game_over_raw, 0, SPRITE_SCALE)
+    game_over_surface  = pygame.transform.rotozoom(game_over_raw, 0, SPRITE_SCALE).convert_alpha()
     game_over_rectangle = game_over_surface.get_rect(
         center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
     )
 
-    # Sound Effects
-    flap_sound  = pygame.mixer.Sound(resource_path('sound', 'sfx_wing.wav'))
-    death_sound = pygame.mixer.Sound(resource_path('sound', 'sfx_hit.wav'))
-    score_sound = pygame.mixer.Sound(resource_path('sound', 'sfx_point.wav'))
+    # Sound Effects (decoded once here; channels 0-2 reserved one per effect)
+    pygame.mixer.set_num_channels(4)
+    pygame.mixer.set_reserved(3)
+    flap_sound  = ChannelSound(pygame.mixer.Sound(resource_path('sound', 'sfx_wing.wav')), pygame.mixer.Channel(0))
+    death_sound = ChannelSound(pygame.mixer.Sound(resource_path('sound', 'sfx_hit.wav')), pygame.mixer.Channel(1))
+    score_sound = ChannelSound(pygame.mixer.Sound(resource_path('sound', 'sfx_point.wav')), pygame.mixer.Channel(2))
 
 except Exception as e:
     print(f"CRITICAL ERROR: Asset loading failed ({e}). Playing in fallback mode.")
@@ -755,11 +985,6 @@ except Exception as e:
         )
     )
     bird_surface.fill((255, 255, 0))
-    bird_rectangle = bird_surface.get_rect(
-        center=(scale_x(BASE_BIRD_X), scale_y(BASE_BIRD_Y))
-    )
-    bird_frames = [bird_surface]
-    bird_index = 0
     pipe_surface = pygame.Surface(
         (
             int(52 * (SCREEN_WIDTH / BASE_SCREEN_WIDTH)),
@@ -784,28 +1009,358 @@ except Exception as e:
     death_sound = MockSound()
     score_sound = MockSound()
 
+# Top pipes use the pipe sprite flipped vertically. Flip once here and pack
+# both orientations side by side into one atlas (upright left, flipped right),
+# so every pipe is drawn from the same source surface. BLEND_RGBA_MAX onto the
+# zeroed atlas copies pixels exactly instead of alpha-blending them.
+PIPE_AREA_BOTTOM = pipe_surface.get_rect()
+PIPE_AREA_TOP    = PIPE_AREA_BOTTOM.move(PIPE_AREA_BOTTOM.width, 0)
+pipe_atlas = pygame.Surface((PIPE_AREA_BOTTOM.width * 2, PIPE_AREA_BOTTOM.height), pygame.SRCALPHA)
+pipe_atlas.blit(pipe_surface, PIPE_AREA_BOTTOM, special_flags=pygame.BLEND_RGBA_MAX)
+pipe_atlas.blit(pygame.transform.flip(pipe_surface, False, True), PIPE_AREA_TOP, special_flags=pygame.BLEND_RGBA_MAX)
+pipe_atlas = pipe_atlas.convert_alpha()
+
+# Two floor tiles side by side, so the scrolling floor is one blit per frame
+floor_strip = pygame.Surface((floor_surface.get_width() * 2, floor_surface.get_height())).convert()
+floor_strip.blit(floor_surface, (0, 0))
+floor_strip.blit(floor_surface, (floor_surface.get_width(), 0))
+
+# Every rotation the bird can show, keyed by angle, so the game loop picks a
+# prerendered sprite instead of resampling one each frame. The level
+# (0 degree) entry is the sprite itself: rotozoom would only resample it.
+bird_rotations = {
+    angle: bird_surface if angle == 0 else pygame.transform.rotozoom(bird_surface, angle, 1).convert_alpha()
+    for angle in range(-BIRD_MAX_TILT_DOWN, BIRD_MAX_TILT_UP + 1, BIRD_ROTATION_STEP)
+}
+
 
 # ============================================================================
 # EVENT TIMERS
 # ============================================================================
+# Pipe spawn timer. It only runs during an attempt: Game.restart() starts it
+# and a collision stops it, so no pipes are generated on the game-over screen.
 SPAWNPIPE = pygame.USEREVENT
-pygame.time.set_timer(SPAWNPIPE, PIPE_SPAWN_TIME)
 
-# Bird flap animation timer (cycles wing frames)
-BIRDFLAP = pygame.USEREVENT + 1
-pygame.time.set_timer(BIRDFLAP, 200)
+# Only queue the event types the game handles. Everything else (mouse motion,
+# other window and audio-device events, ...) is dropped by SDL before it
+# reaches Python. TEXTINPUT stays enabled because KEYDOWN.unicode, which the
+# session dialog relies on, is filled in from it. WINDOWEXPOSED and
+# WINDOWRESTORED tell the dirty-rect renderer to repaint the whole window.
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.TEXTINPUT,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+    SPAWNPIPE,
+])
 
-previous_game_active = False
 # ============================================================================
 # MAIN LOOP
 # ============================================================================
+
+class Game:
+    """
+    Holds the mutable game state and runs the main loop.
+
+    State that changes while playing (bird, pipes, score, floor scroll) lives
+    on the instance instead of in module globals. `run` binds what the
+    per-frame loop uses to local names, so the hot path avoids repeated
+    global and attribute lookups.
+    """
+
+    def __init__(self, logger):
+        """
+        Initialize the game state.
+
+        Parameters:
+            logger (EventLogger): Receives key presses, collisions, etc.
+        """
+        self.logger = logger
+
+        self.bird_movement    = 0
+        self.game_active      = False
+        self.score            = 0
+        self.high_score       = 0
+        self.floor_x_position = 0
+        self.pipe_list        = deque()  # On-screen pipe rects, oldest first
+        self.unpassed_pipes   = deque()  # Bottom pipes not yet scored, oldest first
+        self.bird_rectangle   = bird_surface.get_rect(
+            center=(BIRD_X, BIRD_Y)
+        )
+        # Repaint the whole window next frame instead of only the dirty rects.
+        # Set for the first frame (covers the dialog) and whenever the window
+        # contents may have been lost.
+        self.full_redraw      = True
+
+        # Event dispatch: one dict lookup per event instead of an if-chain.
+        # Types without a handler (TEXTINPUT, only needed by the dialog) are
+        # skipped.
+        self.event_handlers = {
+            pygame.QUIT: self.handle_quit,
+            pygame.KEYDOWN: self.handle_keydown,
+            pygame.MOUSEBUTTONDOWN: self.handle_mouse,
+            SPAWNPIPE: self.handle_spawn_pipe,
+            pygame.WINDOWEXPOSED: self.handle_window_exposed,
+            pygame.WINDOWRESTORED: self.handle_window_exposed,
+        }
+
+        # KEYDOWN dispatch: one dict lookup per key press. Handled keys log a
+        # constant name instead of going through pygame.key.name().
+        self.key_handlers = {
+            pygame.K_SPACE: self.handle_space,
+            pygame.K_ESCAPE: self.handle_escape,
+        }
+        # Log names of other keys, looked up once per key code. The set of
+        # key codes is small and fixed, so this never needs evicting.
+        self.key_names = {}
+
+    # ------------------------------------------------------------------------
+    # Input handling
+    # ------------------------------------------------------------------------
+
+    def flap(self):
+        """Gives the bird its upward flap impulse."""
+        self.bird_movement = 0
+        self.bird_movement -= FLAP_STRENGTH
+        flap_sound.play()
+
+    def restart(self):
+        """Resets the bird, obstacles and score to start a new attempt."""
+        self.game_active      = True
+        self.pipe_list.clear() # Reset obstacles
+        self.unpassed_pipes.clear()
+        self.bird_rectangle.center = (BIRD_X, BIRD_Y)
+        self.bird_movement    = 0
+        self.score            = 0
+        # New Attempt Mechanic: count the attempt as soon as it starts, so its
+        # events are logged under its own id even if no further input arrives
+        self.logger.attempt_id += 1
+        pygame.time.set_timer(SPAWNPIPE, PIPE_SPAWN_TIME)
+
+    def quit(self):
+        """Logs the quit event, closes the log and exits."""
+        self.logger.log_quit()
+        self.logger.close()
+        pygame.quit()
+        sys.exit()
+
+    def handle_quit(self, event):
+        """Window close request."""
+        self.quit()
+
+    def handle_keydown(self, event):
+        """Dispatches a key press to its handler."""
+        self.key_handlers.get(event.key, self.handle_other_key)(event)
+
+    def handle_space(self, event):
+        """SPACE flaps during play and starts a new attempt otherwise."""
+        if self.game_active:
+            self.logger.log_key_press('SPACE')
+            self.flap()
+        else:
+            self.restart()
+
+    def handle_escape(self, event):
+        """ESCAPE quits the game."""
+        if self.game_active:
+            self.logger.log_key_press('ESCAPE')
+        self.quit()
+
+    def handle_other_key(self, event):
+        """Any other key is only logged (during play)."""
+        if self.game_active:
+            name = self.key_names.get(event.key)
+            if name is None:
+                name = self.key_names[event.key] = pygame.key.name(event.key).upper()
+            self.logger.log_key_press(name)
+
+    def handle_mouse(self, event):
+        """Mouse clicks flap / restart like SPACE, logged as MOUSE_CLICK."""
+        if self.game_active:
+            self.logger.log_key_press('MOUSE_CLICK')
+            self.flap()
+        else:
+            self.restart()
+
+    def handle_spawn_pipe(self, event):
+        """SPAWNPIPE timer: add a new pipe pair at the right edge."""
+        if not self.game_active:
+            return  # Queued just before the timer was stopped
+        bottom_pipe, top_pipe = create_pipe()
+        self.pipe_list.extend((bottom_pipe, top_pipe))
+        self.unpassed_pipes.append(bottom_pipe)
+
+    def handle_window_exposed(self, event):
+        """Window uncovered or restored: its contents must be repainted."""
+        self.full_redraw = True
+
+    # ------------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------------
+
+    def update_physics(self):
+        """
+        Advances the simulation by one fixed physics step (1 / PHYSICS_RATE s).
+
+        GRAVITY, FLAP_STRENGTH and PIPE_SPEED are per-step quantities, so the
+        game plays at the same speed whatever frame rate the renderer achieves.
+        """
+        if self.game_active:
+            # 1. Physics: Apply Gravity
+            self.bird_movement += GRAVITY
+            self.bird_rectangle.centery += self.bird_movement
+
+            # 2. Collision Detection
+            collision_result, collision_type = check_collision(self.bird_rectangle, self.pipe_list)
+            if not collision_result:
+                death_sound.play()
+                self.game_active = False
+                pygame.time.set_timer(SPAWNPIPE, 0)
+                self.logger.log_collision(collision_type)
+
+            # 3. Obstacle Update
+            move_pipes(self.pipe_list)
+
+            # 4. Scoring System
+            # Pipes reach the bird in spawn order, so only the oldest unpassed
+            # pair needs checking: it scores once its center X reaches the bird's X.
+            unpassed_pipes = self.unpassed_pipes
+            while unpassed_pipes and unpassed_pipes[0].centerx <= BIRD_X:
+                unpassed_pipes.popleft()
+                self.score += 1
+                score_sound.play()
+                self.logger.log_pipe_passed(self.score)
+
+            # 5. High Score: once the attempt has ended (after this step's
+            # scoring), the score is final and the game-over screen only reads it
+            if not self.game_active:
+                self.high_score = update_score(self.score, self.high_score)
+
+        # Floor scroll (Independent of game state for visual polish)
+        # Wraps within (-floor width, 0]
+        self.floor_x_position = (self.floor_x_position - 1) % -floor_surface.get_width()
+
+    # ------------------------------------------------------------------------
+    # Main loop
+    # ------------------------------------------------------------------------
+
+    def run(self):
+        """
+        The main game loop.
+        Handles events, updates game state, and renders the frame.
+
+        The loop wakes at PHYSICS_RATE so input is read (and logged) every
+        physics step; a frame is only drawn once per 1 / FPS.
+        """
+        logger = self.logger
+        get_handler = self.event_handlers.get
+        get_events = pygame.event.get
+        update_physics = self.update_physics
+        pipe_list = self.pipe_list  # Only ever mutated in place
+        blit = screen.blit
+        tick = clock.tick
+        display_active = pygame.display.get_active
+        display_update = pygame.display.update
+        physics_step = PHYSICS_STEP
+        max_physics_steps = MAX_PHYSICS_STEPS
+        # Draw once 1 / FPS has elapsed. The half-step slack lets two 120 Hz
+        # wakeups whose measured times sum to just under 1/60 s still draw.
+        frame_time = 1.0 / FPS - physics_step / 2
+
+        # Simulated time not yet consumed by physics steps (seconds)
+        physics_lag = 0.0
+        # Time since the last drawn frame (seconds); due on the first pass
+        render_lag = frame_time
+        tick()
+
+        # Dirty-rect rendering: the background is static, so each frame only the
+        # areas drawn in the previous frame are restored and only those plus the
+        # newly drawn areas are pushed to the display.
+        dirty_rects = []
+
+        while True:
+            # Event Handling
+            # Only the allowed event types reach the queue (see EVENT TIMERS),
+            # so a single get() drains everything the game cares about.
+            for event in get_events():
+                handler = get_handler(event.type)
+                if handler is not None:
+                    handler(event)
+
+            # Physics: run as many fixed steps as the elapsed time calls for,
+            # then render once. A slow frame costs rendered frames, not speed.
+            steps = 0
+            while physics_lag >= physics_step and steps < max_physics_steps:
+                update_physics()
+                physics_lag -= physics_step
+                steps += 1
+            if steps == max_physics_steps:
+                # Too far behind (e.g. window drag or stall): drop the backlog
+                # rather than fast-forwarding the game to catch up.
+                physics_lag = 0.0
+
+            # Window minimized / hidden: nothing is visible, so skip drawing and
+            # wake up less often. Physics keeps running on the same clock.
+            if not display_active():
+                pygame.time.wait(INACTIVE_WAIT_MS)
+                physics_lag += tick() / 1000
+                render_lag = frame_time  # Draw as soon as it is visible again
+                self.full_redraw = True  # Window contents may be gone when it returns
+                continue
+
+            # Between frames: only input and physics, then sleep to the next step
+            if render_lag < frame_time:
+                elapsed = tick(PHYSICS_RATE) / 1000
+                physics_lag += elapsed
+                render_lag += elapsed
+                continue
+            render_lag = 0.0
+
+            # Render Background (only under last frame's sprites)
+            if self.full_redraw:
+                blit(background_surface, (0, 0))
+            else:
+                for rect in dirty_rects:
+                    blit(background_surface, rect, rect)
+            previous_rects = dirty_rects
+            dirty_rects = []
+
+            if self.game_active:
+                # --- Active Gameplay State ---
+                rotated_bird = rotate_bird(self.bird_movement)
+                dirty_rects.append(blit(rotated_bird, self.bird_rectangle))
+                dirty_rects.extend(draw_pipes(pipe_list))
+                dirty_rects.extend(score_display('main_game', self.score, self.high_score))
+            else:
+                # --- Game Over State ---
+                dirty_rects.append(blit(game_over_surface, game_over_rectangle))
+                dirty_rects.extend(score_display('game_over', self.score, self.high_score))
+
+            # Debug overlay: show last logged event in the corner (for a short time)
+            if DEBUG_MODE:
+                dirty_rects.extend(debug_event_display(logger))
+
+            # Floor Animation (Independent of game state for visual polish)
+            dirty_rects.extend(draw_floor(self.floor_x_position))
+
+            # Frame Update
+            if self.full_redraw:
+                display_update()
+                self.full_redraw = False
+            else:
+                display_update(previous_rects + dirty_rects)
+            elapsed = tick(PHYSICS_RATE) / 1000
+            physics_lag += elapsed
+            render_lag += elapsed
+
+
 def main():
     """
-    The main game loop.
-    Handles events, updates game state, and renders the frame.
+    Collects the session metadata, sets up the event logger and runs the game.
     """
-    global bird_movement, game_active, score, high_score, bird_index, bird_surface, bird_rectangle, pipe_list, floor_x_position, previous_game_active
-    
     # Initialize event logger and collect session metadata
     arg_metadata = get_session_metadata_from_args()
     if arg_metadata is None:
@@ -818,137 +1373,8 @@ def main():
         subject_id, simulator_run, comments, test_run_guid = arg_metadata
     logger = EventLogger(subject_id, simulator_run, test_run_guid)
     logger.log_event('SESSION_INFO', additional_info=f"subject_id={subject_id};run={simulator_run};test_run_guid={test_run_guid};comments={comments}")
-    
-    while True:
-        # Event Handling
-        for event in pygame.event.get():
-            # New Attempt Mechanic
-            if not previous_game_active and game_active:
-                logger.attempt_id += 1
-                previous_game_active = True
-
-            if event.type == pygame.QUIT:
-                # Log quit event
-                logger.log_quit()
-                logger.close()
-                pygame.quit()
-                sys.exit()
 
-            if event.type == pygame.KEYDOWN:
-                # Log key presses
-                if game_active:
-                    key_name = pygame.key.name(event.key).upper()
-                    logger.log_key_press(key_name)
-                
-                # Flap Mechanic
-                if event.key == pygame.K_SPACE and game_active:
-                    bird_movement = 0
-                    bird_movement -= FLAP_STRENGTH
-                    flap_sound.play()
-
-                # Restart Mechanic
-                if event.key == pygame.K_SPACE and not game_active:
-                    game_active         = True
-                    pipe_list.clear() # Reset obstacles
-                    bird_rectangle.center = (scale_x(BASE_BIRD_X), scale_y(BASE_BIRD_Y))
-                    bird_movement       = 0
-                    score               = 0
-                    previous_game_active = False
-
-                # Quit Mechanic
-                if event.key == pygame.K_ESCAPE:
-                    # Log quit event
-                    logger.log_quit()
-                    logger.close()
-                    pygame.quit()
-                    sys.exit()
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                # Log mouse clicks as key presses
-                if game_active:
-                    logger.log_key_press('MOUSE_CLICK')
-                
-                # Flap Mechanic (Mouse)
-                if game_active:
-                    bird_movement = 0
-                    bird_movement -= FLAP_STRENGTH
-                    flap_sound.play()
-                
-                # Restart Mechanic (Mouse)
-                else:
-                    game_active         = True
-                    pipe_list.clear() # Reset obstacles
-                    bird_rectangle.center = (scale_x(BASE_BIRD_X), scale_y(BASE_BIRD_Y))
-                    bird_movement       = 0
-                    score               = 0
-                    previous_game_active = False
-                    
-            if event.type == SPAWNPIPE:
-                pipe_list.extend(create_pipe())
-
-            if event.type == BIRDFLAP:
-                # Cycle through bird animation frames to create a flapping effect
-                bird_index = (bird_index + 1) % len(bird_frames)
-                bird_surface, bird_rectangle = bird_animation()
-
-        # Render Background
-        screen.blit(background_surface, (0, 0))
-
-        if game_active:
-            # --- Active Gameplay State ---
-
-            # 1. Physics: Apply Gravity
-            bird_movement += GRAVITY
-            
-            # 2. Physics: Rotation
-            rotated_bird = rotate_bird(bird_surface)
-            bird_rectangle.centery += bird_movement
-            screen.blit(rotated_bird, bird_rectangle)
-            
-            # 3. Collision Detection
-            collision_result, collision_type = check_collision(pipe_list)
-            game_active = collision_result
-            if not game_active:
-                logger.log_collision(collision_type)
-
-            # 4. Obstacle Update
-            pipe_list = move_pipes(pipe_list)
-            draw_pipes(pipe_list)
-
-            # 5. Scoring System
-            # Check if bird passed the pipe: detect when the pipe's center X crosses the bird's X
-            bird_x = scale_x(BASE_BIRD_X)
-            for pipe in pipe_list:
-                # centerx is AFTER movement this frame; in the previous frame it was centerx + PIPE_SPEED.
-                # We score when the pipe's center moves from right of the bird to left-of-or-equal in one step.
-                if pipe.centerx <= bird_x < pipe.centerx + PIPE_SPEED:
-                    score += 0.5
-                    if score % 1 == 0:
-                        score_sound.play()
-                        logger.log_pipe_passed(score)
-            
-            score_display('main_game')
-            
-            # 6. Audio Feedback (Score) - Handled above
-        else:
-            # --- Game Over State ---
-            screen.blit(game_over_surface, game_over_rectangle)
-            high_score = update_score(score, high_score)
-            score_display('game_over')
-
-        # Debug overlay: show last logged event in the corner (for a short time)
-        if DEBUG_MODE:
-            debug_event_display(logger)
-
-        # Floor Animation (Independent of game state for visual polish)
-        floor_x_position -= 1
-        draw_floor()
-        if floor_x_position <= -floor_surface.get_width():
-            floor_x_position = 0
-
-        # Frame Update
-        pygame.display.update()
-        clock.tick(FPS)
+    Game(logger).run()
 
 if __name__ == "__main__":
     main()